@@ -3,18 +3,49 @@ import bmesh
 from math import cos, sin, pi, radians, sqrt
 import mathutils
 
-# Clear existing objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+# Clear existing objects and their now-orphaned meshes in one batch
+bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes))
 
 # Animation parameters
 ANIMATION_LENGTH = 300  # frames (10 seconds at 30fps)
 ROTATIONS = 1.5  # Number of full rotations
 FPS = 30
+MOTION_BLUR = False  # Barely visible on a slow spin, but costly in Cycles
+
+# Render parameters
+RENDER_ENGINE = 'BLENDER_EEVEE'  # 'BLENDER_EEVEE' for fast renders, 'CYCLES' for final quality
+
+# Pose angles, converted to radians once
+HAT_TILT = radians(15)
+ARM_RAISE = radians(20)
+ARM_SPREAD = radians(30)
+TRIM_TILT = radians(10)
+WAVE_UP = radians(15)
+WAVE_DOWN = radians(10)
+
+# Target edge length used to pick segment counts, so small parts get less geometry
+AVERAGE_EDGE_LENGTH = 0.05
+
+# Edges between faces meeting at more than this angle stay sharp under smooth shading
+AUTO_SMOOTH_ANGLE = radians(60)
+
+
+# Principled BSDF subsurface input was renamed in Blender 4.0+
+_SUBSURF_INPUT_NAME = 'Subsurface Weight' if bpy.app.version >= (4, 0, 0) else 'Subsurface'
+
+_MAT_CACHE = {}
+
+# Keyframe interpolation enum values, for writing keyframes with foreach_set
+_INTERPOLATION = {item.identifier: item.value
+                  for item in bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items}
 
 
 def create_material(name, base_color, roughness=0.8, metallic=0.0):
-    """Create a principled BSDF material."""
+    """Create a principled BSDF material, reusing it if already created."""
+    key = (name, base_color, roughness, metallic)
+    if key in _MAT_CACHE:
+        return _MAT_CACHE[key]
+
     mat = bpy.data.materials.new(name=name)
     mat.use_nodes = True
     nodes = mat.node_tree.nodes
@@ -29,16 +60,12 @@ def create_material(name, base_color, roughness=0.8, metallic=0.0):
     bsdf.inputs['Roughness'].default_value = roughness
     bsdf.inputs['Metallic'].default_value = metallic
 
-    # Try to set subsurface (name changed in Blender 4.0+)
-    try:
-        bsdf.inputs['Subsurface Weight'].default_value = 0.05
-    except KeyError:
-        try:
-            bsdf.inputs['Subsurface'].default_value = 0.05
-        except KeyError:
-            pass  # Skip if neither exists
+    subsurface = bsdf.inputs.get(_SUBSURF_INPUT_NAME)
+    if subsurface is not None:
+        subsurface.default_value = 0.05
 
     mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+    _MAT_CACHE[key] = mat
     return mat
 
 
@@ -49,20 +76,153 @@ skin_tone = create_material("Skin", (0.9, 0.7, 0.6), roughness=0.6)
 black_material = create_material("Black", (0.05, 0.05, 0.05), roughness=0.7)
 gold_material = create_material("Gold", (0.9, 0.7, 0.2), roughness=0.3, metallic=0.9)
 brown_material = create_material("Brown", (0.3, 0.15, 0.05), roughness=0.8)
+nose_material = create_material("Nose", (0.9, 0.3, 0.3), roughness=0.5)  # Rosy nose
+
+
+def segment_count(radius, minimum, maximum, average_edge_length=AVERAGE_EDGE_LENGTH):
+    """Return the segments needed around a circle of this radius, clamped to a range."""
+    return min(maximum, max(minimum, int(2 * pi * radius / average_edge_length)))
+
+
+def uv_sphere(radius, segments=None, rings=None):
+    """Return a bmesh builder for a UV sphere."""
+    if segments is None:
+        segments = segment_count(radius, 8, 32)
+    if rings is None:
+        rings = max(6, segments // 2)
+
+    def build(bm):
+        bmesh.ops.create_uvsphere(bm, u_segments=segments, v_segments=rings,
+                                  radius=radius, matrix=mathutils.Matrix.Identity(4))
+    return build
+
+
+def cone(radius1, radius2, depth, segments=None):
+    """Return a bmesh builder for a capped cone (a cylinder when both radii match)."""
+    if segments is None:
+        segments = segment_count(max(radius1, radius2), 8, 32)
+
+    def build(bm):
+        bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments,
+                              radius1=radius1, radius2=radius2, depth=depth,
+                              matrix=mathutils.Matrix.Identity(4))
+    return build
+
+
+def cylinder(radius, depth, segments=None):
+    """Return a bmesh builder for a capped cylinder."""
+    return cone(radius, radius, depth, segments)
+
+
+def cube(size):
+    """Return a bmesh builder for a cube."""
+    def build(bm):
+        bmesh.ops.create_cube(bm, size=size, matrix=mathutils.Matrix.Identity(4))
+    return build
+
+
+def torus(major_radius, minor_radius, major_segments=None, minor_segments=None):
+    """Return a bmesh builder for a torus (bmesh.ops has no torus primitive)."""
+    if major_segments is None:
+        major_segments = segment_count(major_radius, 12, 48)
+    if minor_segments is None:
+        minor_segments = segment_count(minor_radius, 6, 12)
+
+    # Trig tables shared by every ring, rather than recomputed per vertex
+    sweep = [(cos(2 * pi * i / major_segments), sin(2 * pi * i / major_segments))
+             for i in range(major_segments)]
+    profile = [(major_radius + minor_radius * cos(2 * pi * j / minor_segments),
+                minor_radius * sin(2 * pi * j / minor_segments))
+               for j in range(minor_segments)]
+
+    def build(bm):
+        new_vert = bm.verts.new
+        verts = [new_vert((ring_radius * c, ring_radius * s, z))
+                 for c, s in sweep for ring_radius, z in profile]
+        for i in range(major_segments):
+            i_next = (i + 1) % major_segments
+            for j in range(minor_segments):
+                j_next = (j + 1) % minor_segments
+                bm.faces.new((verts[i * minor_segments + j],
+                              verts[i_next * minor_segments + j],
+                              verts[i_next * minor_segments + j_next],
+                              verts[i * minor_segments + j_next]))
+    return build
+
+
+def build_mesh(name, bm_build_fn):
+    """Build a mesh datablock with bmesh, bypassing bpy.ops.
+
+    Runs on the main thread: bmesh is not thread-safe and holds the GIL,
+    so building parts in worker threads would not run them in parallel.
+    """
+    mesh = bpy.data.meshes.new(name)
+    bm = bmesh.new()
+    bm_build_fn(bm)
+    bm.to_mesh(mesh)
+    bm.free()
+
+    # Auto smooth moved from mesh properties to sharp_edge attributes in Blender 4.1+
+    if bpy.app.version >= (4, 1, 0):
+        mesh.set_sharp_from_angle(angle=AUTO_SMOOTH_ANGLE)
+    else:
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = AUTO_SMOOTH_ANGLE
+
+    return mesh
+
+
+# Objects built by add_object, linked to the scene in one pass once all parts exist
+_PENDING_OBJECTS = []
+
+
+def add_object(name, mesh, location, scale=(1, 1, 1), rotation=(0, 0, 0), material=None):
+    """Queue a new object for linking.
+
+    Meshes can be shared between objects, so a material that differs from
+    the mesh's own is assigned on the object's slot instead of the mesh.
+    """
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.scale = scale
+    obj.rotation_euler = rotation
+    if material is not None:
+        if not mesh.materials:
+            mesh.materials.append(material)
+        elif mesh.materials[0] != material:
+            slot = obj.material_slots[0]
+            slot.link = 'OBJECT'
+            slot.material = material
+    _PENDING_OBJECTS.append(obj)
+    return obj
+
+
+def add_mesh(name, bm_build_fn, location, scale=(1, 1, 1), rotation=(0, 0, 0), material=None):
+    """Build a mesh with bmesh and queue a new object using it."""
+    return add_object(name, build_mesh(name, bm_build_fn), location, scale, rotation, material)
+
+
+# Unit sphere shared by the small spherical parts, sized per object through scale.
+# Its resolution is chosen for the largest of them (the 0.25 radius mustache).
+unit_sphere = build_mesh("UnitSphere", uv_sphere(1.0, segments=segment_count(0.25, 8, 32)))
+unit_sphere.materials.append(None)
+
+
+def add_sphere(name, radius, location, scale=(1, 1, 1), material=None):
+    """Queue a new object instancing the shared unit sphere."""
+    return add_object(name, unit_sphere, location,
+                      scale=tuple(radius * axis for axis in scale), material=material)
 
 
 # Create Santa's body parts
 def create_body():
     """Create Santa's torso."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=1.2, location=(0, 0, 1.5))
-    body = bpy.context.active_object
-    body.name = "Body"
-    body.scale = (1.0, 0.9, 1.3)
-    body.data.materials.append(red_velvet)
+    body = add_mesh("Body", uv_sphere(1.2), location=(0, 0, 1.5),
+                    scale=(1.0, 0.9, 1.3), material=red_velvet)
 
-    # Add subdivision for smoothness
+    # Add subdivision for smoothness (render-only, keeps viewport evaluation cheap)
     subsurf = body.modifiers.new(name="Subdivision", type='SUBSURF')
-    subsurf.levels = 2
+    subsurf.levels = 0
     subsurf.render_levels = 3
 
     return body
@@ -70,14 +230,11 @@ def create_body():
 
 def create_head():
     """Create Santa's head."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.6, location=(0, 0, 3.2))
-    head = bpy.context.active_object
-    head.name = "Head"
-    head.scale = (1.0, 0.95, 1.1)
-    head.data.materials.append(skin_tone)
+    head = add_mesh("Head", uv_sphere(0.6), location=(0, 0, 3.2),
+                    scale=(1.0, 0.95, 1.1), material=skin_tone)
 
     subsurf = head.modifiers.new(name="Subdivision", type='SUBSURF')
-    subsurf.levels = 2
+    subsurf.levels = 0
     subsurf.render_levels = 3
 
     return head
@@ -86,41 +243,36 @@ def create_head():
 def create_hat():
     """Create Santa's hat."""
     # Hat base (red cone)
-    bpy.ops.mesh.primitive_cone_add(radius1=0.7, radius2=0.15, depth=1.5, location=(0, 0, 4.2))
-    hat = bpy.context.active_object
-    hat.name = "Hat"
-    hat.rotation_euler = (radians(15), 0, 0)  # Slight tilt
-    hat.data.materials.append(red_velvet)
+    hat = add_mesh(
+        "Hat",
+        cone(radius1=0.7, radius2=0.15, depth=1.5),
+        location=(0, 0, 4.2),
+        rotation=(HAT_TILT, 0, 0),  # Slight tilt
+        material=red_velvet
+    )
 
     # Hat brim (white fur)
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=0.65,
-        minor_radius=0.12,
-        location=(0, 0, 3.7)
+    brim = add_mesh(
+        "Hat_Brim",
+        torus(major_radius=0.65, minor_radius=0.12),
+        location=(0, 0, 3.7),
+        material=white_fur
     )
-    brim = bpy.context.active_object
-    brim.name = "Hat_Brim"
-    brim.data.materials.append(white_fur)
 
     # Hat pom-pom
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.2, location=(0, 0.15, 4.8))
-    pompom = bpy.context.active_object
-    pompom.name = "Pompom"
-    pompom.data.materials.append(white_fur)
+    pompom = add_sphere("Pompom", 0.2, location=(0, 0.15, 4.8), material=white_fur)
 
     return [hat, brim, pompom]
 
 
 def create_beard():
     """Create Santa's beard."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.5, location=(0, 0.3, 3.0))
-    beard = bpy.context.active_object
-    beard.name = "Beard"
-    beard.scale = (1.2, 0.7, 1.4)
-    beard.data.materials.append(white_fur)
+    beard = add_mesh("Beard", uv_sphere(0.5), location=(0, 0.3, 3.0),
+                     scale=(1.2, 0.7, 1.4), material=white_fur)
 
     subsurf = beard.modifiers.new(name="Subdivision", type='SUBSURF')
-    subsurf.levels = 2
+    subsurf.levels = 0
+    subsurf.render_levels = 2
 
     return beard
 
@@ -128,32 +280,20 @@ def create_beard():
 def create_mustache():
     """Create Santa's mustache."""
     # Left side
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.25, location=(-0.25, 0.45, 3.25))
-    mustache_l = bpy.context.active_object
-    mustache_l.name = "Mustache_L"
-    mustache_l.scale = (1.3, 0.6, 0.5)
-    mustache_l.data.materials.append(white_fur)
+    mustache_l = add_sphere("Mustache_L", 0.25, location=(-0.25, 0.45, 3.25),
+                            scale=(1.3, 0.6, 0.5), material=white_fur)
 
     # Right side
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.25, location=(0.25, 0.45, 3.25))
-    mustache_r = bpy.context.active_object
-    mustache_r.name = "Mustache_R"
-    mustache_r.scale = (1.3, 0.6, 0.5)
-    mustache_r.data.materials.append(white_fur)
+    mustache_r = add_sphere("Mustache_R", 0.25, location=(0.25, 0.45, 3.25),
+                            scale=(1.3, 0.6, 0.5), material=white_fur)
 
     return [mustache_l, mustache_r]
 
 
 def create_nose():
     """Create Santa's nose."""
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.12, location=(0, 0.55, 3.25))
-    nose = bpy.context.active_object
-    nose.name = "Nose"
-    nose.scale = (0.8, 1.2, 0.9)
-
-    # Rosy nose material
-    nose_mat = create_material("Nose", (0.9, 0.3, 0.3), roughness=0.5)
-    nose.data.materials.append(nose_mat)
+    nose = add_sphere("Nose", 0.12, location=(0, 0.55, 3.25),
+                      scale=(0.8, 1.2, 0.9), material=nose_material)
 
     return nose
 
@@ -161,85 +301,82 @@ def create_nose():
 def create_eyes():
     """Create Santa's eyes."""
     # Left eye
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08, location=(-0.2, 0.5, 3.4))
-    eye_l = bpy.context.active_object
-    eye_l.name = "Eye_L"
-    eye_l.data.materials.append(black_material)
+    eye_l = add_sphere("Eye_L", 0.08, location=(-0.2, 0.5, 3.4), material=black_material)
 
     # Right eye
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.08, location=(0.2, 0.5, 3.4))
-    eye_r = bpy.context.active_object
-    eye_r.name = "Eye_R"
-    eye_r.data.materials.append(black_material)
+    eye_r = add_sphere("Eye_R", 0.08, location=(0.2, 0.5, 3.4), material=black_material)
 
     return [eye_l, eye_r]
 
 
 def create_arms():
-    """Create Santa's arms."""
-    arms = []
+    """Create Santa's arms, returning the upper arms and the hands separately."""
+    upper_arms = []
+    hands = []
+
+    # Both sides share the same mesh data
+    upper_arm_mesh = build_mesh("Arm", cylinder(radius=0.25, depth=1.0))
+    hand_mesh = build_mesh("Hand", uv_sphere(0.22))
 
     for side in [-1, 1]:
         # Upper arm
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.25,
-            depth=1.0,
-            location=(side * 1.2, 0, 1.8)
+        arm = add_object(
+            f"Arm_{'L' if side == -1 else 'R'}",
+            upper_arm_mesh,
+            location=(side * 1.2, 0, 1.8),
+            rotation=(ARM_RAISE, 0, side * ARM_SPREAD),
+            material=red_velvet
         )
-        arm = bpy.context.active_object
-        arm.name = f"Arm_{'L' if side == -1 else 'R'}"
-        arm.rotation_euler = (radians(20), 0, radians(side * 30))
-        arm.data.materials.append(red_velvet)
 
         # Hand/mitten
-        bpy.ops.mesh.primitive_uv_sphere_add(
-            radius=0.22,
-            location=(side * 1.5, -0.2, 1.2)
+        hand = add_object(
+            f"Hand_{'L' if side == -1 else 'R'}",
+            hand_mesh,
+            location=(side * 1.5, -0.2, 1.2),
+            scale=(1.0, 1.2, 0.8),
+            material=red_velvet
         )
-        hand = bpy.context.active_object
-        hand.name = f"Hand_{'L' if side == -1 else 'R'}"
-        hand.scale = (1.0, 1.2, 0.8)
-        hand.data.materials.append(red_velvet)
 
-        arms.extend([arm, hand])
+        upper_arms.append(arm)
+        hands.append(hand)
 
-    return arms
+    return upper_arms, hands
 
 
 def create_legs():
     """Create Santa's legs."""
     legs = []
 
+    # Both sides share the same mesh data
+    leg_mesh = build_mesh("Leg", cylinder(radius=0.28, depth=1.2))
+    boot_mesh = build_mesh("Boot", cube(0.5))
+    cuff_mesh = build_mesh("Boot_Cuff", torus(major_radius=0.3, minor_radius=0.08))
+
     for side in [-1, 1]:
         # Leg
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=0.28,
-            depth=1.2,
-            location=(side * 0.4, 0, 0.3)
+        leg = add_object(
+            f"Leg_{'L' if side == -1 else 'R'}",
+            leg_mesh,
+            location=(side * 0.4, 0, 0.3),
+            material=red_velvet
         )
-        leg = bpy.context.active_object
-        leg.name = f"Leg_{'L' if side == -1 else 'R'}"
-        leg.data.materials.append(red_velvet)
 
         # Boot
-        bpy.ops.mesh.primitive_cube_add(
-            size=0.5,
-            location=(side * 0.4, 0.15, -0.4)
+        boot = add_object(
+            f"Boot_{'L' if side == -1 else 'R'}",
+            boot_mesh,
+            location=(side * 0.4, 0.15, -0.4),
+            scale=(1.0, 1.5, 0.8),
+            material=black_material
         )
-        boot = bpy.context.active_object
-        boot.name = f"Boot_{'L' if side == -1 else 'R'}"
-        boot.scale = (1.0, 1.5, 0.8)
-        boot.data.materials.append(black_material)
 
         # Boot cuff
-        bpy.ops.mesh.primitive_torus_add(
-            major_radius=0.3,
-            minor_radius=0.08,
-            location=(side * 0.4, 0, -0.15)
+        cuff = add_object(
+            f"Boot_Cuff_{'L' if side == -1 else 'R'}",
+            cuff_mesh,
+            location=(side * 0.4, 0, -0.15),
+            material=white_fur
         )
-        cuff = bpy.context.active_object
-        cuff.name = f"Boot_Cuff_{'L' if side == -1 else 'R'}"
-        cuff.data.materials.append(white_fur)
 
         legs.extend([leg, boot, cuff])
 
@@ -249,35 +386,31 @@ def create_legs():
 def create_belt():
     """Create Santa's belt."""
     # Belt main
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=1.05,
-        minor_radius=0.12,
-        location=(0, 0, 1.2)
+    belt = add_mesh(
+        "Belt",
+        torus(major_radius=1.05, minor_radius=0.12),
+        location=(0, 0, 1.2),
+        scale=(1.0, 0.9, 0.3),
+        material=black_material
     )
-    belt = bpy.context.active_object
-    belt.name = "Belt"
-    belt.scale = (1.0, 0.9, 0.3)
-    belt.data.materials.append(black_material)
 
     # Belt buckle
-    bpy.ops.mesh.primitive_cube_add(
-        size=0.35,
-        location=(0, 0.95, 1.2)
+    buckle = add_mesh(
+        "Buckle",
+        cube(0.35),
+        location=(0, 0.95, 1.2),
+        scale=(1.2, 0.3, 0.8),
+        material=gold_material
     )
-    buckle = bpy.context.active_object
-    buckle.name = "Buckle"
-    buckle.scale = (1.2, 0.3, 0.8)
-    buckle.data.materials.append(gold_material)
 
     # Buckle center (hole)
-    bpy.ops.mesh.primitive_cube_add(
-        size=0.2,
-        location=(0, 0.95, 1.2)
+    buckle_hole = add_mesh(
+        "Buckle_Hole",
+        cube(0.2),
+        location=(0, 0.95, 1.2),
+        scale=(0.8, 1.0, 0.6),
+        material=black_material
     )
-    buckle_hole = bpy.context.active_object
-    buckle_hole.name = "Buckle_Hole"
-    buckle_hole.scale = (0.8, 1.0, 0.6)
-    buckle_hole.data.materials.append(black_material)
 
     return [belt, buckle, buckle_hole]
 
@@ -287,56 +420,66 @@ def create_coat_trim():
     trims = []
 
     # Bottom trim
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=1.15,
-        minor_radius=0.15,
-        location=(0, 0, 0.9)
+    trim_bottom = add_mesh(
+        "Trim_Bottom",
+        torus(major_radius=1.15, minor_radius=0.15),
+        location=(0, 0, 0.9),
+        scale=(1.0, 0.9, 0.4),
+        material=white_fur
     )
-    trim_bottom = bpy.context.active_object
-    trim_bottom.name = "Trim_Bottom"
-    trim_bottom.scale = (1.0, 0.9, 0.4)
-    trim_bottom.data.materials.append(white_fur)
     trims.append(trim_bottom)
 
     # Front trim (left side)
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.12,
-        depth=2.0,
-        location=(0.45, 0.85, 1.8)
+    trim_front_l = add_mesh(
+        "Trim_Front_L",
+        cylinder(radius=0.12, depth=2.0),
+        location=(0.45, 0.85, 1.8),
+        rotation=(TRIM_TILT, 0, 0),
+        material=white_fur
     )
-    trim_front_l = bpy.context.active_object
-    trim_front_l.name = "Trim_Front_L"
-    trim_front_l.rotation_euler = (radians(10), 0, 0)
-    trim_front_l.data.materials.append(white_fur)
     trims.append(trim_front_l)
 
     # Front trim (right side)
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.12,
-        depth=2.0,
-        location=(-0.45, 0.85, 1.8)
+    trim_front_r = add_mesh(
+        "Trim_Front_R",
+        cylinder(radius=0.12, depth=2.0),
+        location=(-0.45, 0.85, 1.8),
+        rotation=(TRIM_TILT, 0, 0),
+        material=white_fur
     )
-    trim_front_r = bpy.context.active_object
-    trim_front_r.name = "Trim_Front_R"
-    trim_front_r.rotation_euler = (radians(10), 0, 0)
-    trim_front_r.data.materials.append(white_fur)
     trims.append(trim_front_r)
 
     # Collar
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=0.65,
-        minor_radius=0.12,
-        location=(0, 0, 2.8)
+    collar = add_mesh(
+        "Collar",
+        torus(major_radius=0.65, minor_radius=0.12),
+        location=(0, 0, 2.8),
+        scale=(1.0, 0.95, 0.5),
+        material=white_fur
     )
-    collar = bpy.context.active_object
-    collar.name = "Collar"
-    collar.scale = (1.0, 0.95, 0.5)
-    collar.data.materials.append(white_fur)
     trims.append(collar)
 
     return trims
 
 
+def set_keyframes(id_data, data_path, index, keyframes, interpolation='BEZIER'):
+    """Write (frame, value) keyframes onto a new F-curve in one batch."""
+    anim_data = id_data.animation_data or id_data.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(name=f"{id_data.name}Action")
+
+    if bpy.app.version >= (4, 4, 0):  # Slotted actions; Action.fcurves is gone in 5.0
+        fcurve = anim_data.action.fcurve_ensure_for_datablock(id_data, data_path, index=index)
+    else:
+        fcurve = anim_data.action.fcurves.new(data_path=data_path, index=index)
+    points = fcurve.keyframe_points
+    points.add(count=len(keyframes))
+    points.foreach_set("co", [component for keyframe in keyframes for component in keyframe])
+    points.foreach_set("interpolation", [_INTERPOLATION[interpolation]] * len(keyframes))
+    fcurve.update()
+    return fcurve
+
+
 # Build Santa!
 print("Creating Santa Claus...")
 
@@ -363,8 +506,9 @@ all_parts.append(nose)
 eyes = create_eyes()
 all_parts.extend(eyes)
 
-arms = create_arms()
-all_parts.extend(arms)
+arm_upper_objects, arm_hand_objects = create_arms()
+all_parts.extend(arm_upper_objects)
+all_parts.extend(arm_hand_objects)
 
 legs = create_legs()
 all_parts.extend(legs)
@@ -375,20 +519,29 @@ all_parts.extend(belt_parts)
 trim_parts = create_coat_trim()
 all_parts.extend(trim_parts)
 
+# Link every part in a single pass, then evaluate the scene once
+collection = bpy.context.collection
+for obj in _PENDING_OBJECTS:
+    collection.objects.link(obj)
+_PENDING_OBJECTS.clear()
+bpy.context.view_layer.update()
+
 # Create an empty to act as parent for all parts
-bpy.ops.object.empty_add(location=(0, 0, 1.5))
-santa_root = bpy.context.active_object
-santa_root.name = "Santa"
+santa_root = bpy.data.objects.new("Santa", None)
+santa_root.location = (0, 0, 1.5)
+collection.objects.link(santa_root)
 
 # Parent all parts to the root
+parent_inverse = mathutils.Matrix.Identity(4)
 for part in all_parts:
     part.parent = santa_root
+    part.matrix_parent_inverse = parent_inverse
 
-# Apply smooth shading to all parts
-for part in all_parts:
-    part.select_set(True)
-bpy.ops.object.shade_smooth()
-bpy.ops.object.select_all(action='DESELECT')
+# Apply smooth shading to every mesh once, sharing one flag buffer across meshes
+meshes = {part.data for part in all_parts}
+smooth_flags = memoryview(bytes([1]) * max(len(mesh.polygons) for mesh in meshes))
+for mesh in meshes:
+    mesh.polygons.foreach_set("use_smooth", smooth_flags[:len(mesh.polygons)])
 
 # ===== CAMERA SETUP =====
 bpy.ops.object.camera_add(location=(8, -6, 2.5))
@@ -397,10 +550,10 @@ camera.rotation_euler = (radians(85), 0, radians(50))
 camera.data.lens = 50
 bpy.context.scene.camera = camera
 
-# Add slight depth of field for cinematic look
+# Add slight depth of field for cinematic look (a narrow aperture keeps lens noise low)
 camera.data.dof.use_dof = True
 camera.data.dof.focus_distance = 10.0
-camera.data.dof.aperture_fstop = 4.0
+camera.data.dof.aperture_fstop = 8.0
 
 # ===== LIGHTING SETUP =====
 
@@ -469,49 +622,55 @@ bpy.context.scene.render.fps = FPS
 # Animate Santa rotation
 santa_root.rotation_mode = 'XYZ'
 santa_root.rotation_euler = (0, 0, 0)
-santa_root.keyframe_insert(data_path="rotation_euler", frame=1)
-
-final_rotation = 2 * pi * ROTATIONS
-santa_root.rotation_euler = (0, 0, final_rotation)
-santa_root.keyframe_insert(data_path="rotation_euler", frame=ANIMATION_LENGTH)
 
 # Linear interpolation for smooth rotation
-fcurves = santa_root.animation_data.action.fcurves
-for fcurve in fcurves:
-    for keyframe in fcurve.keyframe_points:
-        keyframe.interpolation = 'LINEAR'
+final_rotation = 2 * pi * ROTATIONS
+set_keyframes(santa_root, "rotation_euler", 2, [(1, 0), (ANIMATION_LENGTH, final_rotation)],
+              interpolation='LINEAR')
 
 # Add slight wave animation to arms
-for arm in [obj for obj in all_parts if 'Arm' in obj.name]:
-    arm.rotation_euler.z = arm.rotation_euler.z
-    arm.keyframe_insert(data_path="rotation_euler", frame=1)
-
-    # Wave up
+for arm in arm_upper_objects:
     original_z = arm.rotation_euler.z
-    arm.rotation_euler.z = original_z + radians(15)
-    arm.keyframe_insert(data_path="rotation_euler", frame=ANIMATION_LENGTH // 3)
-
-    # Wave down
-    arm.rotation_euler.z = original_z - radians(10)
-    arm.keyframe_insert(data_path="rotation_euler", frame=2 * ANIMATION_LENGTH // 3)
-
-    # Return
-    arm.rotation_euler.z = original_z
-    arm.keyframe_insert(data_path="rotation_euler", frame=ANIMATION_LENGTH)
+    set_keyframes(arm, "rotation_euler", 2, [
+        (1, original_z),
+        (ANIMATION_LENGTH // 3, original_z + WAVE_UP),  # Wave up
+        (2 * ANIMATION_LENGTH // 3, original_z - WAVE_DOWN),  # Wave down
+        (ANIMATION_LENGTH, original_z),  # Return
+    ])
 
 # Pulsing lights for festive effect
 for light, phase in [(red_accent, 0), (green_accent, ANIMATION_LENGTH // 4)]:
-    light.data.energy = 100
-    light.data.keyframe_insert(data_path="energy", frame=1 + phase)
-    light.data.energy = 200
-    light.data.keyframe_insert(data_path="energy", frame=ANIMATION_LENGTH // 2 + phase)
-    light.data.energy = 100
-    light.data.keyframe_insert(data_path="energy", frame=ANIMATION_LENGTH + phase)
+    set_keyframes(light.data, "energy", 0, [
+        (1 + phase, 100),
+        (ANIMATION_LENGTH // 2 + phase, 200),
+        (ANIMATION_LENGTH + phase, 100),
+    ])
 
 # ===== RENDER SETTINGS =====
 
-bpy.context.scene.render.engine = 'CYCLES'
-bpy.context.scene.cycles.samples = 128
+if RENDER_ENGINE == 'CYCLES':
+    bpy.context.scene.render.engine = 'CYCLES'
+    bpy.context.scene.cycles.samples = 128
+    bpy.context.scene.cycles.use_adaptive_sampling = True
+    bpy.context.scene.cycles.adaptive_threshold = 0.01
+    bpy.context.scene.cycles.adaptive_min_samples = 16
+else:
+    # EEVEE is registered as BLENDER_EEVEE_NEXT in Blender 4.2 to 4.x
+    if RENDER_ENGINE == 'BLENDER_EEVEE' and (4, 2, 0) <= bpy.app.version < (5, 0, 0):
+        bpy.context.scene.render.engine = 'BLENDER_EEVEE_NEXT'
+    else:
+        bpy.context.scene.render.engine = RENDER_ENGINE
+    if bpy.context.scene.render.engine in ('BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT'):
+        bpy.context.scene.eevee.taa_render_samples = 64
+        if hasattr(bpy.context.scene.eevee, 'use_gtao'):  # Always on from Blender 5.0
+            bpy.context.scene.eevee.use_gtao = True
+
+# Only transforms change between frames, so keep BVH and shaders across the animation
+bpy.context.scene.render.use_persistent_data = True
+
+# Don't redraw the interface while the animation renders
+bpy.context.scene.render.use_lock_interface = True
+
 bpy.context.scene.render.resolution_x = 1920
 bpy.context.scene.render.resolution_y = 1080
 bpy.context.scene.render.resolution_percentage = 100
@@ -525,20 +684,21 @@ bpy.context.scene.render.ffmpeg.ffmpeg_preset = 'BEST'
 bpy.context.scene.render.filepath = '/tmp/santa_animation.mp4'
 
 # Motion blur
-bpy.context.scene.render.use_motion_blur = True
-bpy.context.scene.render.motion_blur_shutter = 0.5
-
-# Denoising
-bpy.context.scene.cycles.use_denoising = True
-bpy.context.view_layer.cycles.use_denoising = True
-
-# GPU rendering on Mac
-bpy.context.scene.cycles.device = 'GPU'
-preferences = bpy.context.preferences.addons['cycles'].preferences
-preferences.compute_device_type = 'METAL'
-preferences.get_devices()
-for device in preferences.devices:
-    device.use = True
+bpy.context.scene.render.use_motion_blur = MOTION_BLUR
+bpy.context.scene.render.motion_blur_shutter = 0.1
+
+if RENDER_ENGINE == 'CYCLES':
+    # Denoising
+    bpy.context.scene.cycles.use_denoising = True
+    bpy.context.view_layer.cycles.use_denoising = True
+
+    # GPU rendering on Mac
+    bpy.context.scene.cycles.device = 'GPU'
+    preferences = bpy.context.preferences.addons['cycles'].preferences
+    preferences.compute_device_type = 'METAL'
+    preferences.get_devices()
+    for device in preferences.devices:
+        device.use = True
 
 print("\n" + "=" * 60)
 print("🎅 SANTA CLAUS GENERATED SUCCESSFULLY! 🎅")
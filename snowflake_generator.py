@@ -1,11 +1,13 @@
 import bpy
-import bmesh
+from collections import deque
 from math import cos, sin, pi, radians
-import mathutils
+import numpy as np
 
-# Clear existing mesh objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+# Clear existing objects, their orphaned meshes and the arm collection in one batch
+stale = list(bpy.data.objects) + list(bpy.data.meshes)
+if "Snowflake_Arm" in bpy.data.collections:
+    stale.append(bpy.data.collections["Snowflake_Arm"])
+bpy.data.batch_remove(stale)
 
 # Snowflake parameters
 ARM_COUNT = 6  # Hexagonal symmetry
@@ -16,152 +18,278 @@ BRANCH_ANGLE = 30  # degrees
 BRANCH_LENGTH_RATIO = 0.6
 THICKNESS = 0.08
 BRANCH_THICKNESS_RATIO = 0.7
+N_SIDES = 8  # Vertices around the main arm cylinders, halved per branch level (min 6)
 
 # Animation parameters
 ANIMATION_LENGTH = 240  # frames (8 seconds at 30fps, 10 seconds at 24fps)
 ROTATIONS = 2  # Number of full rotations during animation
 FPS = 30
+MOTION_BLUR = False  # 3 degrees per frame barely smears, but each ray samples several transforms
 
 
-def create_cylinder_between_points(p1, p2, radius, name="Branch"):
-    """Create a cylinder between two points."""
-    # Calculate direction and length
-    direction = p2 - p1
-    length = direction.length
+def z_rotation(angle):
+    """Return the 3x3 matrix rotating by angle around the Z axis."""
+    c, s = cos(angle), sin(angle)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]], dtype=np.float32)
 
-    if length < 0.001:  # Too short to create
-        return None
 
-    # Create cylinder
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=radius,
-        depth=length,
-        location=(p1 + p2) / 2
-    )
+# Sub-branch directions turn by BRANCH_ANGLE to either side of their parent
+LEFT_ROT = z_rotation(radians(BRANCH_ANGLE))
+RIGHT_ROT = LEFT_ROT.T
 
-    cylinder = bpy.context.active_object
-    cylinder.name = name
 
-    # Rotate to align with direction
-    direction.normalize()
-    z_axis = mathutils.Vector((0, 0, 1))
+_TEMPLATE_CACHE = {}
 
-    # Calculate rotation
-    if abs(direction.dot(z_axis)) < 0.9999:
-        rotation_axis = z_axis.cross(direction)
-        rotation_angle = z_axis.angle(direction)
-        cylinder.rotation_mode = 'AXIS_ANGLE'
-        cylinder.rotation_axis_angle = (rotation_angle, *rotation_axis)
-    elif direction.dot(z_axis) < 0:
-        cylinder.rotation_euler = (pi, 0, 0)
 
-    return cylinder
+def create_template_cylinder(n_sides):
+    """Create a unit cylinder (radius 1, depth 1, centred on the origin).
 
+    Returns vertex positions plus per-face corner counts and flat corner
+    vertex indices, reused for every call with the same side count.
+    """
+    if n_sides in _TEMPLATE_CACHE:
+        return _TEMPLATE_CACHE[n_sides]
 
-def create_branch(start_point, direction, length, thickness, level=0, max_level=BRANCH_LEVELS):
-    """Recursively create a branch with sub-branches."""
-    objects = []
+    angles = np.arange(n_sides, dtype=np.float32) * np.float32(2 * pi / n_sides)
+    ring = np.stack([np.cos(angles), np.sin(angles)], axis=1)
 
-    # Calculate end point
-    end_point = start_point + direction * length
+    verts = np.concatenate([
+        np.column_stack([ring, np.full(n_sides, -0.5, dtype=np.float32)]),  # Bottom ring
+        np.column_stack([ring, np.full(n_sides, 0.5, dtype=np.float32)]),  # Top ring
+    ])
 
-    # Create main branch segment
-    cylinder = create_cylinder_between_points(start_point, end_point, thickness)
-    if cylinder:
-        objects.append(cylinder)
+    faces = [(i, (i + 1) % n_sides, n_sides + (i + 1) % n_sides, n_sides + i)
+             for i in range(n_sides)]
+    faces.append(tuple(reversed(range(n_sides))))  # Bottom cap
+    faces.append(tuple(range(n_sides, 2 * n_sides)))  # Top cap
 
-    # Add sub-branches if not at max level
-    if level < max_level:
-        # Calculate positions along the branch for sub-branches
-        num_sub_branches = 2 + level  # More sub-branches on earlier levels
+    loop_totals = np.array([len(face) for face in faces], dtype=np.int32)
+    loop_indices = np.concatenate(faces).astype(np.int32)
 
-        for i in range(1, num_sub_branches):
-            # Position along main branch
-            t = i / num_sub_branches
-            sub_start = start_point + direction * length * t
+    _TEMPLATE_CACHE[n_sides] = verts, loop_totals, loop_indices
+    return _TEMPLATE_CACHE[n_sides]
 
-            # Create two sub-branches (left and right)
-            for side in [-1, 1]:
-                # Rotate direction for sub-branch
-                angle = radians(BRANCH_ANGLE * side)
 
-                # Create rotation matrix around z-axis
-                rot_z = mathutils.Matrix.Rotation(angle, 3, 'Z')
-                sub_direction = rot_z @ direction
+def create_mesh(name, coords, loop_totals, loop_indices):
+    """Create a mesh from flat vertex and face-corner arrays using foreach_set."""
+    mesh = bpy.data.meshes.new(name)
 
-                sub_length = length * BRANCH_LENGTH_RATIO * (1 - t * 0.3)
-                sub_thickness = thickness * BRANCH_THICKNESS_RATIO
+    mesh.vertices.add(len(coords))
+    if bpy.app.version >= (3, 5, 0):
+        mesh.attributes["position"].data.foreach_set("vector", coords.ravel())
+    else:
+        mesh.vertices.foreach_set("co", coords.ravel())
 
-                # Recursively create sub-branch
-                sub_objects = create_branch(
-                    sub_start,
-                    sub_direction,
-                    sub_length,
-                    sub_thickness,
-                    level + 1,
-                    max_level
-                )
-                objects.extend(sub_objects)
+    mesh.loops.add(len(loop_indices))
+    mesh.loops.foreach_set("vertex_index", loop_indices)
 
-    return objects
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(loop_totals) - loop_totals).astype(np.int32))
+    if bpy.app.version < (4, 0, 0):  # Face sizes follow from loop_start offsets from 4.0
+        mesh.polygons.foreach_set("loop_total", loop_totals)
 
+    mesh.update(calc_edges=True)
+    return mesh
 
-def create_snowflake():
-    """Create the complete snowflake with hexagonal symmetry."""
-    all_objects = []
-
-    # Create 6 main arms with hexagonal symmetry
-    for i in range(ARM_COUNT):
-        angle = (2 * pi * i) / ARM_COUNT
-
-        # Direction for this arm
-        direction = mathutils.Vector((cos(angle), sin(angle), 0))
-        start_point = mathutils.Vector((0, 0, 0))
-
-        # Create the main arm and its branches
-        arm_objects = create_branch(
-            start_point,
-            direction,
-            ARM_LENGTH,
-            THICKNESS
-        )
-        all_objects.extend(arm_objects)
-
-    # Add center hexagon
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=THICKNESS * 2,
-        depth=THICKNESS * 1.5,
-        location=(0, 0, 0)
-    )
-    center = bpy.context.active_object
-    center.name = "Center"
-    all_objects.append(center)
-
-    return all_objects
 
+def rotations_from_z(dirs):
+    """Return (N, 3, 3) matrices rotating the +Z axis onto each unit direction."""
+    cos_a = dirs[:, 2]
+    sin_a = np.sqrt(np.clip(1 - cos_a ** 2, 0, None))
+    parallel = sin_a < 1e-6
+
+    # Rotation axis is z x direction, normalized (zero where already parallel to Z)
+    axes = np.stack([-dirs[:, 1], dirs[:, 0], np.zeros(len(dirs), dtype=np.float32)], axis=1)
+    axes /= np.where(parallel, 1.0, sin_a)[:, np.newaxis]
+
+    # Rodrigues' formula: R = I + sin(a) K + (1 - cos(a)) K^2
+    k = np.zeros((len(dirs), 3, 3), dtype=np.float32)
+    k[:, 0, 1], k[:, 0, 2] = -axes[:, 2], axes[:, 1]
+    k[:, 1, 0], k[:, 1, 2] = axes[:, 2], -axes[:, 0]
+    k[:, 2, 0], k[:, 2, 1] = -axes[:, 1], axes[:, 0]
+    rotations = (np.eye(3, dtype=np.float32) + sin_a[:, np.newaxis, np.newaxis] * k
+                 + (1 - cos_a)[:, np.newaxis, np.newaxis] * (k @ k))
+
+    # Directions pointing down -Z: half turn around X
+    rotations[parallel & (cos_a < 0)] = np.diag([1.0, -1.0, -1.0])
+    return rotations
 
-# Create the snowflake
-print("Generating snowflake...")
-snowflake_objects = create_snowflake()
 
-# Join all objects into one
-bpy.ops.object.select_all(action='DESELECT')
-for obj in snowflake_objects:
-    obj.select_set(True)
+def place_cylinders(template_verts, starts, dirs, lengths, radii):
+    """Return (N, V, 3) template cylinder verts spanning each branch segment."""
+    rotations = rotations_from_z(dirs)
 
-bpy.context.view_layer.objects.active = snowflake_objects[0]
-bpy.ops.object.join()
+    # Fold the per-cylinder (radius, radius, length) scale into the rotation columns
+    scales = np.stack([radii, radii, lengths], axis=1)
+    transforms = rotations * scales[:, np.newaxis, :]
 
-snowflake = bpy.context.active_object
-snowflake.name = "Snowflake"
+    midpoints = starts + dirs * (lengths / 2)[:, np.newaxis]
+    return np.einsum('nij,vj->nvi', transforms, template_verts) + midpoints[:, np.newaxis, :]
 
-# Add smooth shading
-bpy.ops.object.shade_smooth()
+
+def count_branches(max_level=BRANCH_LEVELS):
+    """Return how many branches make up one arm, including the arm itself."""
+    total = 0
+    branches_at_level = 1
+    for level in range(max_level + 1):
+        total += branches_at_level
+        branches_at_level *= 2 * (1 + level)  # Left and right pair at each sub-branch position
+    return total
+
+
+def enumerate_branches(arm_dir, max_level=BRANCH_LEVELS):
+    """Flatten one arm's branch tree into start, direction, length, radius and level arrays."""
+    count = count_branches(max_level)
+    starts = np.empty((count, 3), dtype=np.float32)
+    dirs = np.empty((count, 3), dtype=np.float32)
+    lengths = np.empty(count, dtype=np.float32)
+    radii = np.empty(count, dtype=np.float32)
+    levels = np.empty(count, dtype=np.int32)
+
+    queue = deque([(np.zeros(3, dtype=np.float32), np.asarray(arm_dir, dtype=np.float32),
+                    ARM_LENGTH, THICKNESS, 0)])
+    n = 0
+    while queue:
+        start_point, direction, length, thickness, level = queue.popleft()
+        starts[n] = start_point
+        dirs[n] = direction
+        lengths[n] = length
+        radii[n] = thickness
+        levels[n] = level
+        n += 1
+
+        # Queue sub-branches if not at max level
+        if level < max_level:
+            # Calculate positions along the branch for sub-branches
+            num_sub_branches = 2 + level  # More sub-branches on earlier levels
+
+            for i in range(1, num_sub_branches):
+                # Position along main branch
+                t = i / num_sub_branches
+                sub_start = start_point + direction * length * t
+
+                # Create two sub-branches (right and left)
+                for rot_z in (RIGHT_ROT, LEFT_ROT):
+                    queue.append((
+                        sub_start,
+                        rot_z @ direction,
+                        length * BRANCH_LENGTH_RATIO * (1 - t * 0.3),
+                        thickness * BRANCH_THICKNESS_RATIO,
+                        level + 1
+                    ))
+
+    return starts[:n], dirs[:n], lengths[:n], radii[:n], levels[:n]
+
+
+def offset_copies(loop_indices, copies, vertex_count):
+    """Repeat face-corner indices for consecutive copies of the same vertex block."""
+    offsets = np.arange(copies, dtype=np.int32) * vertex_count
+    return (loop_indices[np.newaxis, :] + offsets[:, np.newaxis]).ravel()
+
+
+def create_snowflake():
+    """Create the complete snowflake with hexagonal symmetry."""
+    # Angles of all arms, evenly spaced around Z
+    arm_angles = np.arange(ARM_COUNT) * (2 * pi / ARM_COUNT)
+
+    # Enumerate the first arm and its branches
+    starts, dirs, lengths, radii, levels = enumerate_branches((1, 0, 0))
+    keep = lengths >= 0.001  # Too short to create
+    starts, dirs, lengths, radii, levels = (
+        starts[keep], dirs[keep], lengths[keep], radii[keep], levels[keep])
+    dirs /= np.linalg.norm(dirs, axis=1)[:, np.newaxis]
+
+    # Size the vertex and face buffers for every branch up front, with fewer
+    # cylinder sides on thinner levels
+    templates = [create_template_cylinder(max(6, N_SIDES >> level))
+                 for level in range(BRANCH_LEVELS + 1)]
+    branch_counts = np.bincount(levels, minlength=BRANCH_LEVELS + 1)
+    arm_verts = np.empty((sum(count * len(template[0]) for template, count
+                              in zip(templates, branch_counts)), 3), dtype=np.float32)
+    arm_loop_totals = np.empty(sum(count * len(template[1]) for template, count
+                                   in zip(templates, branch_counts)), dtype=np.int32)
+    arm_loops = np.empty(sum(count * len(template[2]) for template, count
+                             in zip(templates, branch_counts)), dtype=np.int32)
+
+    # Place a template cylinder for every branch, writing each level at the cursors
+    v_cursor = f_cursor = l_cursor = 0
+    for level, (template_verts, template_loop_totals, template_loops) in enumerate(templates):
+        selected = levels == level
+        branch_count = int(branch_counts[level])
+        if branch_count == 0:
+            continue
+
+        v_count = branch_count * len(template_verts)
+        f_count = branch_count * len(template_loop_totals)
+        l_count = branch_count * len(template_loops)
+        arm_verts[v_cursor:v_cursor + v_count] = place_cylinders(
+            template_verts, starts[selected], dirs[selected],
+            lengths[selected], radii[selected]).reshape(-1, 3)
+        arm_loop_totals[f_cursor:f_cursor + f_count] = np.tile(template_loop_totals, branch_count)
+        arm_loops[l_cursor:l_cursor + l_count] = (
+            offset_copies(template_loops, branch_count, len(template_verts)) + v_cursor)
+        v_cursor += v_count
+        f_cursor += f_count
+        l_cursor += l_count
+
+    arm_mesh = create_mesh("Snowflake_Arm", arm_verts, arm_loop_totals, arm_loops)
+
+    # Add center hexagon: a 6-sided prism (12 verts, 8 faces) centred on the origin
+    center_verts, center_loop_totals, center_loops = create_template_cylinder(6)
+    center_mesh = create_mesh("Snowflake_Center",
+                              center_verts * np.array((THICKNESS * 2, THICKNESS * 2, THICKNESS * 1.5),
+                                                      dtype=np.float32),
+                              center_loop_totals, center_loops)
+
+    # Add smooth shading
+    for mesh in (arm_mesh, center_mesh):
+        mesh.polygons.foreach_set("use_smooth", np.ones(len(mesh.polygons), dtype=bool))
+
+    # Root empty that carries the whole snowflake
+    collection = bpy.context.collection
+    snowflake = bpy.data.objects.new("Snowflake", None)
+    collection.objects.link(snowflake)
+
+    # The arm sits in its own collection, instanced once per arm direction, so its
+    # subdivided geometry is evaluated once and shared by every arm at render time
+    arm_collection = bpy.data.collections.new("Snowflake_Arm")
+    arm = bpy.data.objects.new("Arm", arm_mesh)
+    arm_collection.objects.link(arm)
+
+    for i, angle in enumerate(arm_angles):
+        arm_instance = bpy.data.objects.new(f"Arm{i}", None)
+        arm_instance.instance_type = 'COLLECTION'
+        arm_instance.instance_collection = arm_collection
+        arm_instance.rotation_euler = (0, 0, angle)
+        arm_instance.parent = snowflake
+        collection.objects.link(arm_instance)
+
+    center = bpy.data.objects.new("Center", center_mesh)
+    center.parent = snowflake
+    collection.objects.link(center)
+
+    bpy.context.view_layer.objects.active = snowflake
+    return snowflake, [arm, center]
+
+
+# Create the snowflake
+print("Generating snowflake...")
+snowflake, snowflake_parts = create_snowflake()
 
 # Add subdivision surface modifier for smoother appearance
-subsurf = snowflake.modifiers.new(name="Subdivision", type='SUBSURF')
-subsurf.levels = 2
-subsurf.render_levels = 3
+for part in snowflake_parts:
+    subsurf = part.modifiers.new(name="Subdivision", type='SUBSURF')
+    subsurf.levels = 1 if N_SIDES >= 16 else 2  # Each level multiplies the side count
+    subsurf.render_levels = 3  # Only used when adaptive subdivision is unavailable
+
+    # Let Cycles dice to ~1 pixel edges instead of a fixed render level, so distant
+    # sub-pixel branches don't carry 64x their polygon count into the BVH
+    if hasattr(subsurf, 'use_adaptive_subdivision'):  # Blender 5.0+
+        subsurf.use_adaptive_subdivision = True
+        subsurf.adaptive_pixel_size = 1.0
+    else:
+        part.cycles.use_adaptive_subdivision = True
+        part.cycles.dicing_rate = 1.0
 
 # Create enhanced ice material with more visual interest
 mat = bpy.data.materials.new(name="Ice_Material")
@@ -220,11 +348,13 @@ links.new(mix1.outputs['Shader'], mix2.inputs[2])
 links.new(mix2.outputs['Shader'], output.inputs['Surface'])
 
 # Assign material to snowflake
-snowflake.data.materials.append(mat)
+for part in snowflake_parts:
+    part.data.materials.append(mat)
 
 # Setup camera with slight tilt for dynamic view
-bpy.ops.object.camera_add(location=(15, -10, 6))
-camera = bpy.context.active_object
+camera = bpy.data.objects.new("Camera", bpy.data.cameras.new("Camera"))
+bpy.context.collection.objects.link(camera)
+camera.location = (15, -10, 6)
 camera.rotation_euler = (radians(70), 0, radians(50))
 camera.data.lens = 85  # Slightly telephoto for nice compression
 
@@ -236,34 +366,39 @@ camera.data.dof.use_dof = True
 camera.data.dof.focus_distance = 18.0
 camera.data.dof.aperture_fstop = 2.8
 
-# Setup cinematic lighting
+# Setup cinematic lighting, created through bpy.data rather than light_add operators
 # Key light - main bright light from above-right
-bpy.ops.object.light_add(type='AREA', location=(12, -8, 12))
-key_light = bpy.context.active_object
+key_light = bpy.data.objects.new("Key_Light", bpy.data.lights.new("Key_Light", type='AREA'))
+bpy.context.collection.objects.link(key_light)
+key_light.location = (12, -8, 12)
 key_light.data.energy = 300
 key_light.data.size = 6
 key_light.data.color = (1.0, 0.98, 0.95)  # Warm white
 key_light.rotation_euler = (radians(45), 0, radians(35))
 
 # Fill light - softer, cooler light from the left
-bpy.ops.object.light_add(type='AREA', location=(-10, -6, 8))
-fill_light = bpy.context.active_object
+fill_light = bpy.data.objects.new("Fill_Light", bpy.data.lights.new("Fill_Light", type='AREA'))
+bpy.context.collection.objects.link(fill_light)
+fill_light.location = (-10, -6, 8)
 fill_light.data.energy = 120
 fill_light.data.size = 8
 fill_light.data.color = (0.85, 0.90, 1.0)  # Cool blue
 fill_light.rotation_euler = (radians(50), 0, radians(-30))
 
 # Rim/back light - creates edge highlights
-bpy.ops.object.light_add(type='AREA', location=(2, 10, 5))
-rim_light = bpy.context.active_object
+rim_light = bpy.data.objects.new("Rim_Light", bpy.data.lights.new("Rim_Light", type='AREA'))
+bpy.context.collection.objects.link(rim_light)
+rim_light.location = (2, 10, 5)
 rim_light.data.energy = 250
 rim_light.data.size = 5
 rim_light.data.color = (0.9, 0.95, 1.0)  # Cool rim light
 rim_light.rotation_euler = (radians(60), 0, radians(180))
 
 # Accent light - adds sparkle from below
-bpy.ops.object.light_add(type='POINT', location=(0, 0, -5))
-accent_light = bpy.context.active_object
+accent_light = bpy.data.objects.new("Accent_Light",
+                                    bpy.data.lights.new("Accent_Light", type='POINT'))
+bpy.context.collection.objects.link(accent_light)
+accent_light.location = (0, 0, -5)
 accent_light.data.energy = 100
 accent_light.data.color = (1.0, 1.0, 1.0)
 accent_light.data.shadow_soft_size = 0.5
@@ -312,23 +447,11 @@ bpy.context.scene.frame_start = 1
 bpy.context.scene.frame_end = ANIMATION_LENGTH
 bpy.context.scene.render.fps = FPS
 
-# Animate snowflake rotation
-snowflake.rotation_mode = 'XYZ'
-snowflake.rotation_euler = (0, 0, 0)
-
-# Set initial keyframe
-snowflake.keyframe_insert(data_path="rotation_euler", frame=1)
-
-# Set final keyframe (multiple rotations)
-final_rotation = 2 * pi * ROTATIONS
-snowflake.rotation_euler = (0, 0, final_rotation)
-snowflake.keyframe_insert(data_path="rotation_euler", frame=ANIMATION_LENGTH)
-
-# Set interpolation to linear for constant rotation speed
-fcurves = snowflake.animation_data.action.fcurves
-for fcurve in fcurves:
-    for keyframe in fcurve.keyframe_points:
-        keyframe.interpolation = 'LINEAR'
+# Animate snowflake rotation with a driver: constant speed from frame 1 to the
+# last frame, evaluated per frame with no keyframes to interpolate
+rotation_speed = 2 * pi * ROTATIONS / (ANIMATION_LENGTH - 1)  # radians per frame
+rotation_driver = snowflake.driver_add("rotation_euler", 2).driver
+rotation_driver.expression = f"(frame - 1) * {rotation_speed!r}"
 
 # Optional: Add subtle wobble for more organic movement
 # Uncomment these lines if you want a slight floating motion
@@ -339,21 +462,29 @@ for fcurve in fcurves:
 # snowflake.location = (0, 0, 0)
 # snowflake.keyframe_insert(data_path="location", frame=ANIMATION_LENGTH)
 
-# Optional: Animate a light for dynamic lighting effects
-key_light.data.energy = 300
-key_light.data.keyframe_insert(data_path="energy", frame=1)
-key_light.data.energy = 400
-key_light.data.keyframe_insert(data_path="energy", frame=ANIMATION_LENGTH // 2)
-key_light.data.energy = 300
-key_light.data.keyframe_insert(data_path="energy", frame=ANIMATION_LENGTH)
+# Optional: Animate a light for dynamic lighting effects (300 -> 400 -> 300)
+energy_driver = key_light.data.driver_add("energy").driver
+energy_driver.expression = f"300 + 100 * sin((frame - 1) * {pi / (ANIMATION_LENGTH - 1)!r})"
 
 # Setup render settings for high-quality video
 bpy.context.scene.render.engine = 'CYCLES'
+if hasattr(bpy.context.scene.cycles, 'feature_set'):  # Adaptive subdivision is experimental before 5.0
+    bpy.context.scene.cycles.feature_set = 'EXPERIMENTAL'
+bpy.context.scene.cycles.dicing_rate = 1.0
 bpy.context.scene.cycles.samples = 128  # Good balance of quality and speed
+bpy.context.scene.cycles.use_adaptive_sampling = True
+bpy.context.scene.cycles.adaptive_threshold = 0.01  # Stop early on the converged dark background
 bpy.context.scene.render.resolution_x = 1920
 bpy.context.scene.render.resolution_y = 1080  # 16:9 for video
 bpy.context.scene.render.resolution_percentage = 100
 
+# Keep BVH, meshes and shaders between frames; only transforms change during the spin
+bpy.context.scene.render.use_persistent_data = True
+
+# Render each frame as a single GPU-sized tile
+bpy.context.scene.cycles.use_auto_tile = True
+bpy.context.scene.cycles.tile_size = 2048
+
 # Video output settings
 bpy.context.scene.render.image_settings.file_format = 'FFMPEG'
 bpy.context.scene.render.ffmpeg.format = 'MPEG4'
@@ -362,12 +493,17 @@ bpy.context.scene.render.ffmpeg.constant_rate_factor = 'HIGH'  # High quality
 bpy.context.scene.render.ffmpeg.ffmpeg_preset = 'BEST'
 bpy.context.scene.render.filepath = '/tmp/snowflake_animation.mp4'
 
-# Enable motion blur for smoother animation
-bpy.context.scene.render.use_motion_blur = True
-bpy.context.scene.render.motion_blur_shutter = 0.5
+# Motion blur for smoother animation, with a short centred shutter when enabled
+bpy.context.scene.render.use_motion_blur = MOTION_BLUR
+bpy.context.scene.render.motion_blur_shutter = 0.1
+bpy.context.scene.render.motion_blur_position = 'CENTER'
+bpy.context.scene.cycles.rolling_shutter_type = 'NONE'
 
 # Enable denoising for cleaner renders
 bpy.context.scene.cycles.use_denoising = True
+bpy.context.scene.cycles.denoiser = 'OPENIMAGEDENOISE'
+if hasattr(bpy.context.scene.cycles, 'denoising_use_gpu'):  # Blender 4.1+
+    bpy.context.scene.cycles.denoising_use_gpu = True
 bpy.context.view_layer.cycles.use_denoising = True
 
 # Use GPU if available (much faster!)